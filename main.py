@@ -1,14 +1,17 @@
+import asyncio
+import hashlib
+import io
+import os
 import shutil
 import logging
+import multiprocessing
 import tempfile
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI, UploadFile, File, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
-import uvicorn
-
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+from fastapi.responses import FileResponse, StreamingResponse
 
 # Import main fuctions
 from src.processor import process_document
@@ -18,19 +21,227 @@ from src.logger import setup_logging
 setup_logging(level=logging.INFO)
 logger = logging.getLogger("API")
 
-app = FastAPI(title="Docx Formatter API")
+# Size of the blocks used when copying uploads to disk (1 MiB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Processed results are cached by the SHA-256 of the uploaded bytes,
+# keeping only the most recently used ones
+CACHE_DIR_PREFIX = "docx_formatter_cache_"
+CACHE_MAX_ENTRIES = 128
+
+# Archive entry listing the files of a batch that couldn't be processed
+ARCHIVE_ERRORS_NAME = "errors.txt"
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Creates the process pool shared by all requests and shuts it down with the app.
+    python-docx work is CPU-bound and holds the GIL, so documents are processed
+    in separate processes to run in parallel.
+    """
+    # The workers are started on the first job, when worker threads (asyncio.to_thread) are already
+    # running, and forking a multi-threaded process can deadlock the child.
+    # They are started from a clean server process instead (or spawned where there is no forkserver)
+    start_method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+    app.state.pool = ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        mp_context=multiprocessing.get_context(start_method)
+    )
+    logger.info("Started process pool with %s workers.", os.cpu_count())
+
+    # Each process gets its own private cache directory (mode 0700, unguessable name),
+    # so nothing else on the machine can plant results in it and other workers don't share or wipe it.
+    # It is created empty, so results from older formatting rules are never served
+    app.state.cache_dir = Path(tempfile.mkdtemp(prefix=CACHE_DIR_PREFIX))
+    yield
+    app.state.pool.shutdown()
+    shutil.rmtree(app.state.cache_dir)
+
+app = FastAPI(title="Docx Formatter API", lifespan=lifespan)
 
-def cleanup_files(paths: list[Path]):
+def save_upload(file: UploadFile, destination: Path):
     """
-    Background task to remove temporary files after the response is sent.
+    Copies the uploaded file to disk.
+    Uploads that were spilled to a real file are copied inside the kernel with os.sendfile,
+    otherwise it falls back to a block copy.
+    This is blocking, so it's meant to be run in a worker thread.
     """
-    for path in paths:
+    source = file.file
+    source.seek(0)
+
+    # Small uploads are kept in memory by SpooledTemporaryFile, and asking for their
+    # fileno() would first write them to disk, so they go straight to the block copy
+    if hasattr(os, "sendfile") and getattr(source, "_rolled", True):
+        try:
+            with destination.open("wb") as buffer:
+                src_fd = source.fileno()
+                dst_fd = buffer.fileno()
+                while os.sendfile(dst_fd, src_fd, None, UPLOAD_CHUNK_SIZE):
+                    pass
+            return
+        except (OSError, io.UnsupportedOperation):
+            # No usable file descriptor, or the platform can't sendfile into a regular file
+            source.seek(0)
+
+    with destination.open("wb") as buffer:
+        shutil.copyfileobj(source, buffer, UPLOAD_CHUNK_SIZE)
+
+def file_digest(path: Path) -> str:
+    """
+    Returns the SHA-256 hex digest of a file, read in large blocks.
+    """
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(UPLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def get_cached_result(cache_dir: Path, digest: str, output_path: Path) -> bool:
+    """
+    Puts the cached processed file for the digest at output_path.
+    Returns False if there isn't one.
+    The file is linked (or copied) into the request's own directory, so evicting
+    the cache entry can't pull it away while the response is being sent.
+    """
+    cached_path = cache_dir / f"{digest}.docx"
+    try:
+        # Mark the entry as recently used
+        os.utime(cached_path)
         try:
-            if path.exists():
-                path.unlink()
-                logger.info("Cleaned up temp file: %s", path)
-        except Exception as e:
-            logger.exception("Failed to delete temp file %s: %s", path, e)
+            os.link(cached_path, output_path)
+        except OSError:
+            # No hard links on this filesystem
+            shutil.copyfile(cached_path, output_path)
+    except FileNotFoundError:
+        return False
+    return True
+
+def store_cached_result(cache_dir: Path, digest: str, output_path: Path):
+    """
+    Copies a processed file into the cache and evicts the least recently used entries.
+    """
+    # Copy under a temporary name first, so other requests never see a partial file
+    fd, tmp_name = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    os.close(fd)
+    shutil.copyfile(output_path, tmp_name)
+    os.replace(tmp_name, cache_dir / f"{digest}.docx")
+
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(".docx"):
+            try:
+                entries.append((entry.stat().st_mtime, entry.path))
+            except FileNotFoundError:
+                # Evicted by another request in the meantime
+                continue
+
+    entries.sort(reverse=True)
+    for _, stale_path in entries[CACHE_MAX_ENTRIES:]:
+        Path(stale_path).unlink(missing_ok=True)
+
+def run_process_document(input_path: Path, output_path: Path) -> list[str]:
+    """
+    Runs process_document inside a pool worker.
+    Only the issues are returned, since the Document object can't be sent back between processes.
+    """
+    _, issues = process_document(input_path, output_path)
+    return issues
+
+async def process_upload(file: UploadFile, input_path: Path, output_path: Path) -> tuple[Path, list[str]]:
+    """
+    Saves an uploaded file to disk and processes it in the process pool.
+    Identical uploads are served from the result cache instead of being processed again.
+    Returns the path of the processed file, which doesn't exist if the document failed validation,
+    and the validation issues.
+    """
+    # Save uploaded file to disk
+    # The copy is blocking, so it runs in a worker thread to keep the event loop free
+    logger.info("Receiving file: %s", file.filename)
+    await asyncio.to_thread(save_upload, file, input_path)
+
+    # Check the cache for an identical upload
+    digest = await asyncio.to_thread(file_digest, input_path)
+    cache_dir = app.state.cache_dir
+    if await asyncio.to_thread(get_cached_result, cache_dir, digest, output_path):
+        logger.info("Serving cached result for: %s", file.filename)
+        return output_path, []
+
+    # Run the main processor function in the process pool
+    loop = asyncio.get_running_loop()
+    issues = await loop.run_in_executor(app.state.pool, run_process_document, input_path, output_path)
+
+    # Only documents that passed validation are cached
+    if output_path.exists():
+        await asyncio.to_thread(store_cached_result, cache_dir, digest, output_path)
+
+    return output_path, issues
+
+def archive_name(filename: str, used_names: set[str]) -> str:
+    """
+    Returns the archive entry name for a processed file.
+    Uploads with the same name get a numbered suffix, so no entry overwrites another one when extracted.
+    """
+    name = f"processed_{filename}"
+    stem, suffix = os.path.splitext(name)
+    count = 1
+    while name in used_names:
+        count += 1
+        name = f"{stem}_{count}{suffix}"
+    used_names.add(name)
+    return name
+
+def build_archive(entries: list[tuple[Path, str]], errors: list[str]) -> tempfile.SpooledTemporaryFile:
+    """
+    Writes the (path, name) entries to a zip archive and returns it rewound to the start.
+    Files that couldn't be processed are listed in an errors entry.
+    Small archives stay in memory, larger ones spill to disk.
+    """
+    archive = tempfile.SpooledTemporaryFile(max_size=16 * UPLOAD_CHUNK_SIZE)
+
+    # .docx files are already zip-compressed, so they are stored as they are
+    with zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_STORED) as zf:
+        for path, name in entries:
+            zf.write(path, arcname=name)
+
+        if errors:
+            zf.writestr(ARCHIVE_ERRORS_NAME, "\n".join(errors))
+
+    archive.seek(0)
+    return archive
+
+def iter_archive(archive: tempfile.SpooledTemporaryFile):
+    """
+    Streams the archive in chunks and closes it once everything is sent.
+    """
+    with archive:
+        while chunk := archive.read(UPLOAD_CHUNK_SIZE):
+            yield chunk
+
+def remove_path(path: Path):
+    """
+    Removes a temporary file or directory (with its contents) if it exists.
+    """
+    if path.is_dir():
+        shutil.rmtree(path)
+        logger.info("Cleaned up temp directory: %s", path)
+    elif path.exists():
+        path.unlink()
+        logger.info("Cleaned up temp file: %s", path)
+
+async def cleanup_files(paths: list[Path]):
+    """
+    Background task to remove temporary files and directories after the response is sent.
+    It runs on the event loop, so it doesn't hold a threadpool slot for the whole cleanup,
+    and the paths are deleted concurrently.
+    """
+    results = await asyncio.gather(
+        *(asyncio.to_thread(remove_path, path) for path in paths),
+        return_exceptions=True
+    )
+
+    for path, result in zip(paths, results):
+        if isinstance(result, Exception):
+            logger.error("Failed to delete temp path %s: %s", path, result, exc_info=result)
 
 @app.post("/process-document/")
 async def api_process_document(
@@ -46,39 +257,120 @@ async def api_process_document(
 
     # Create temporary directories/files
     # This is necessary to store the input and be able to access it
-    temp_dir = Path(tempfile.gettempdir())
-    
-    input_tmp = temp_dir / f"upload_{file.filename}"
-    output_tmp = temp_dir / f"processed_{file.filename}"
+    # Each request gets its own directory, so concurrent uploads with the same name don't collide.
+    # It also collects the '_WITH_ISSUES' files written when validation fails
+    work_dir = Path(tempfile.mkdtemp(prefix="docx_formatter_"))
+    filename = Path(file.filename).name
+
+    input_tmp = work_dir / f"upload_{filename}"
+    output_tmp = work_dir / f"processed_{filename}"
 
     try:
-        # Save uploaded file to disk
-        logger.info("Receiving file: %s", file.filename)
-        with input_tmp.open("wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
+        # Save the upload and run the main processor function
+        processed_path, issues = await process_upload(file, input_tmp, output_tmp)
 
-        # Run the main processor function
-        process_document(input_tmp, output_tmp)
+    except Exception as e:
+        # Clean up immediately if something failed before response
+        await cleanup_files([work_dir])
+        logger.error("API Error: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    # Validation failures leave no processed file behind, only the '_WITH_ISSUES' copy
+    if not processed_path.exists():
+        await cleanup_files([work_dir])
+        raise HTTPException(
+            status_code=422,
+            detail={
+                "message": "Validation failed.",
+                "issues": [issue.strip() for issue in issues]
+            }
+        )
+
+    # Schedule the Cleanup
+    # BackgroundTasks runs AFTER the response is sent.
+    background_tasks.add_task(cleanup_files, [work_dir])
+
+    # Return the file
+    return FileResponse(
+        path=processed_path,
+        filename=f"processed_{filename}",
+        media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+    )
+
+@app.post("/process-documents/")
+async def api_process_documents(
+    background_tasks: BackgroundTasks,
+    files: list[UploadFile] = File(...)
+):
+    """
+    Endpoint to upload several docx files, process them concurrently, and download the results as a zip.
+    """
+    # File Type Validation
+    for file in files:
+        if not file.filename.endswith(".docx"):
+            raise HTTPException(status_code=400, detail=f"Invalid file type for '{file.filename}'. Only .docx is supported.")
+
+    # Create temporary files in a directory owned by this request
+    # The index keeps uploads with the same name from overwriting each other
+    work_dir = Path(tempfile.mkdtemp(prefix="docx_formatter_"))
+    filenames = [Path(file.filename).name for file in files]
+
+    input_tmps = [work_dir / f"upload_{i}_{filename}" for i, filename in enumerate(filenames)]
+    output_tmps = [work_dir / f"processed_{i}_{filename}" for i, filename in enumerate(filenames)]
+
+    try:
+        # Save and process all the uploads concurrently through the process pool
+        # A failing file doesn't stop the others, and every job has finished before the
+        # work directory can be cleaned up
+        results = await asyncio.gather(*(
+            process_upload(file, input_tmp, output_tmp)
+            for file, input_tmp, output_tmp in zip(files, input_tmps, output_tmps)
+        ), return_exceptions=True)
+
+        # Files that raised an error or failed validation have no processed output,
+        # so they are left out of the archive and listed in its errors entry instead
+        entries = []
+        errors = []
+        used_names = set()
+        for filename, result in zip(filenames, results):
+            if isinstance(result, Exception):
+                logger.error("Failed to process %s: %s", filename, result, exc_info=result)
+                errors.append(f"{filename}: Processing failed. {result}")
+                continue
+
+            processed_path, issues = result
+            if processed_path.exists():
+                entries.append((processed_path, archive_name(filename, used_names)))
+            else:
+                logger.warning("No processed output for %s. It's left out of the archive.", filename)
+                errors.append(
+                    f"{filename}: Validation failed.\n"
+                    + "\n".join(f"  - {issue.strip()}" for issue in issues)
+                )
+
+        archive = await asyncio.to_thread(build_archive, entries, errors)
 
         # Schedule the Cleanup
-        # BackgroundTasks runs AFTER the response is sent.
-        background_tasks.add_task(cleanup_files, [input_tmp, output_tmp])
-
-        # Return the file
-        return FileResponse(
-            path=output_tmp,
-            filename=f"processed_{file.filename}",
-            media_type="application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+        background_tasks.add_task(cleanup_files, [work_dir])
+
+        # Return the archive
+        return StreamingResponse(
+            iter_archive(archive),
+            media_type="application/zip",
+            headers={"Content-Disposition": 'attachment; filename="processed_documents.zip"'}
         )
 
     except Exception as e:
         # Clean up immediately if something failed before response
-        cleanup_files([input_tmp, output_tmp])
-        logger.error(f"API Error: {e}", exc_info=True)
+        await cleanup_files([work_dir])
+        logger.error("API Error: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
-    
+
 
 if __name__ == "__main__":
+    # Only needed when the server is started from this script
+    import uvicorn
+
     # reload = True, assuming it's a development version
     logger.info("Starting Uvicorn server...")
     uvicorn.run(
@@ -1,17 +1,10 @@
 import argparse
 import logging
 import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 from pathlib import Path
 
-
-# Safety check for importing main functions
-try:
-    from src.logger import setup_logging
-    from src.processor import process_document
-except ImportError as e:
-    sys.exit(f"Setup Error: Could not import modules from 'src'. \nDetails: {e}")
+from src.logger import setup_logging
+from src.processor import process_document
 
 # Initialize logger variable
 logger = logging.getLogger("CLI")
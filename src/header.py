@@ -1,10 +1,38 @@
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 from src.config import StyleConfig
 from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.text.paragraph import Paragraph
+import copy
 import re
 
+# Cover page patterns, compiled once at import time
+_DATE_RE = re.compile(
+    r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\b.*\d{4}',
+    re.IGNORECASE
+)
+_FORMERLY_RE = re.compile(r"\(formerly\b", re.IGNORECASE)
+_TITLE_RE = re.compile(r'^(.*?)(\(formerly)(.*?)(\))$', re.IGNORECASE)
+
+# Namespace-qualified tags, resolved once instead of per element visited
+_W_P = qn('w:p')
+_W_T = qn('w:t')
+
+# Blank row template, parsed once and copied for every inserted row
+# The paragraph mark uses the configured font (size is stored in half-points)
+_BLANK_P = parse_xml(
+    f'<w:p {nsdecls("w")}><w:pPr><w:rPr>'
+    f'<w:rFonts w:ascii="{StyleConfig.FONT_NAME}" w:hAnsi="{StyleConfig.FONT_NAME}"/>'
+    f'<w:sz w:val="{int(StyleConfig.FONT_SIZE.pt * 2)}"/>'
+    '</w:rPr></w:pPr></w:p>'
+)
+
+def _p_text(p_elem):
+    """
+    Returns the text of a <w:p> element by joining its <w:t> nodes, without a Paragraph wrapper.
+    """
+    return "".join(t.text or "" for t in p_elem.iter(_W_T))
+
 class CoverPageProcessor:
     def __init__(self, doc):
         self.doc = doc
@@ -12,9 +40,11 @@ class CoverPageProcessor:
     def process(self):
         """
         Processes the cover page of the document.
+        Both steps share one walk over the body: styling continues from the
+        first row with text found while normalizing the vertical alignment.
         """
-        self._normalize_vertical_alignment()
-        self._apply_text_styling()
+        first_text_p = self._normalize_vertical_alignment()
+        self._apply_text_styling(first_text_p)
 
     def _is_row_blank(self, item):
         """
@@ -22,86 +52,74 @@ class CoverPageProcessor:
         """
         if item is None:
             return True
-    
-        text = ""
-        
-        # It's a paragraph text
-        if hasattr(item, 'text'):
-            text = item.text
-            
-        # It's a low-level XML Element
-        elif hasattr(item, 'findall'):
-            t_tags = item.findall('.//w:t', namespaces=item.nsmap)
-            text = "".join([t.text for t in t_tags if t.text])
-            
-        return not bool(text and text.strip())
-
-    def _set_font(self, paragraph, size):
-        """
-        Set the font (provided in the StyleConfig) and size of a paragraph.
-        """
-        for run in paragraph.runs:
-            run.font.name = StyleConfig.FONT_NAME
-            run.font.size = size
+
+        # A paragraph is checked through its low-level XML Element
+        element = getattr(item, '_element', item)
+
+        # Stop at the first <w:t> with visible text instead of joining all of them
+        for t in element.iter(_W_T):
+            if t.text and t.text.strip():
+                return False
+
+        return True
+
+    def _new_blank_paragraph(self):
+        """
+        Returns a new empty <w:p> element whose paragraph mark uses the configured font and size.
+        """
+        return copy.deepcopy(_BLANK_P)
+
+    def _next_paragraph(self, p_elem):
+        """
+        Returns the next <w:p> sibling of a paragraph element, skipping tables and other body items.
+        """
+        next_element = p_elem.getnext()
+        while next_element is not None and next_element.tag != _W_P:
+            next_element = next_element.getnext()
+        return next_element
 
     def _normalize_vertical_alignment(self):
         """
         Ensures the first row with text is row 19.
+        Returns the <w:p> element of the first row with text (None if there is no text).
         """
-        all_paragraphs = self.doc.paragraphs
+        # Read the body paragraphs once instead of rebuilding doc.paragraphs on every access
+        body = self.doc.element.body
+        p_elems = body.findall(_W_P)
 
-        # Find the index of the first non-empty paragraphfirst_test_index
-        first_text_index = 0
-        found_text = False
-        
-        for i, p in enumerate(all_paragraphs):
-            if not self._is_row_blank(p):
+        # Find the index of the first non-empty paragraph
+        first_text_index = len(p_elems)
+        first_text_p = None
+
+        for i, p_elem in enumerate(p_elems):
+            if not self._is_row_blank(p_elem):
                 first_text_index = i
-                found_text = True
+                first_text_p = p_elem
                 break
 
-        if not found_text:
-            first_text_index = len(all_paragraphs)
-
         # Calculate how many blank rows have to be inserted
         required_index = StyleConfig.COVER_START_ROW - 1
 
         if first_text_index < required_index:
             missing_lines = required_index - first_text_index
+
+            # Insert the blank rows (already in the required size) straight into the body
             for _ in range(missing_lines):
-                p = self.doc.paragraphs[0].insert_paragraph_before("")
-                # Ensure blank rows are the required size
-                self._set_font(p, StyleConfig.FONT_SIZE)
+                if p_elems:
+                    p_elems[0].addprevious(self._new_blank_paragraph())
+                else:
+                    body.insert(0, self._new_blank_paragraph())
 
         # If the number of whitespaces is larger than the required index
         elif first_text_index > required_index:
-            # We need to remove some lines
+            # We need to remove some lines from the top.
+            # Every paragraph before first_text_index is blank, so they can be removed directly
             lines_to_remove = first_text_index - required_index
-            
-            # We remove from the top 
-            removed_count = 0
-            
-            # Use a while loop because the paragraphs list changes size as we delete (for loop would break)
-            while removed_count < lines_to_remove:
-                # Always look at the current first paragraph
-                # Break if the doc becomes empty
-                if not self.doc.paragraphs: 
-                    break 
-                
-                p_to_remove = self.doc.paragraphs[0]
-                
-                # Only delete if it is actually empty
-                if self._is_row_blank(p_to_remove):
-                    p_element = p_to_remove._element
-                    p_element.getparent().remove(p_element)
-                    p_to_remove._p = p_to_remove._element = None
-                    
-                    removed_count += 1
-                else:
-                    # We hit text before we finished deleting. Stop to prevent data loss.
-                    # Although it's unlikely, it's a good safety test
-                    print(f"Warning: Stopped deleting rows. Found unexpected text at row {removed_count}.")
-                    break
+
+            for p_elem in p_elems[:lines_to_remove]:
+                body.remove(p_elem)
+
+        return first_text_p
 
     def _format_company_title(self, paragraph):
         """
@@ -112,7 +130,7 @@ class CoverPageProcessor:
         paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
 
         # Splits the title to four groups (defined below)
-        match = re.search(r'^(.*?)(\(formerly)(.*?)(\))$', full_text, re.IGNORECASE)
+        match = _TITLE_RE.search(full_text)
         
         if match:
             parts = [
@@ -145,33 +163,50 @@ class CoverPageProcessor:
                 else:
                     run.text = text_part.title()
 
+    def _capitalize_second_char(self, paragraph):
+        """
+        Upper-cases the second visible character of a paragraph in place, keeping its runs.
+        Returns False if the character couldn't be found in the runs.
+        """
+        runs = paragraph.runs
+        full_text = "".join(run.text for run in runs)
+
+        # Position of the second character, skipping leading whitespace
+        target = len(full_text) - len(full_text.lstrip()) + 1
+
+        for run in runs:
+            run_text = run.text
+            if target < len(run_text):
+                run.text = run_text[:target] + run_text[target].upper() + run_text[target + 1:]
+                return True
+            target -= len(run_text)
+
+        return False
+
     def _enforce_one_blank_row_after(self, current_paragraph):
         """
         This function ensures that after each text line there is one blank row
         """
-        next_element = current_paragraph._element.getnext()
+        current_element = current_paragraph._element
+        next_element = current_element.getnext()
 
         # End of document
         if next_element is None:
-            new_p = self.doc.add_paragraph("") 
-            self._set_font(new_p, StyleConfig.FONT_SIZE)
+            current_element.addnext(self._new_blank_paragraph())
             return
 
-        
-        if next_element.tag.endswith('p'):
+        if next_element.tag == _W_P:
             # If next element is text
             if not self._is_row_blank(next_element):
                 # Insert a blank row before this text paragraph (after our current one)
-                next_p_obj = self.doc.paragraphs[self.doc.element.body.index(next_element)]
-                new_p = next_p_obj.insert_paragraph_before("")
-                self._set_font(new_p, StyleConfig.FONT_SIZE)
-                
+                next_element.addprevious(self._new_blank_paragraph())
+
             # if next line is a blank row
             else:
                 sibling_of_next = next_element.getnext()
 
                 while sibling_of_next is not None and \
-                      sibling_of_next.tag.endswith('p') and \
+                      sibling_of_next.tag == _W_P and \
                       self._is_row_blank(sibling_of_next):
 
                     # Remove the second blank row
@@ -181,64 +216,76 @@ class CoverPageProcessor:
                     # Update the pointer to check the next one
                     sibling_of_next = next_element.getnext()
 
-    def _apply_text_styling(self):
+    def _apply_text_styling(self, start):
         """
         Adjusts the text styling for the cover page including the title and other components.
+        Walks the body paragraphs from `start`, the first row with text.
         """
-        i = 0
         n_rows_to_check = 30
-        while i < n_rows_to_check and i < len(self.doc.paragraphs):
-            p = self.doc.paragraphs[i]
-            text = p.text.strip()
+        row = StyleConfig.COVER_START_ROW - 1
+        p_elem = start
 
-            date_regex = r'\b(January|February|March|April|May|June|July|August|September|October|November|December)\b.*\d{4}'
+        # Looked up once instead of in every branch of the loop
+        normal_style = self.doc.styles['Normal']
+        font_name = StyleConfig.FONT_NAME
+        font_size = StyleConfig.FONT_SIZE
+
+        while p_elem is not None and row < n_rows_to_check:
+            # Read the text straight from the XML. The python-docx wrapper is only
+            # built for rows that match one of the rules and get styled
+            text = _p_text(p_elem).strip()
+            lowered = text.lower()
 
             # Title
             # Look for "... (formerly ...)" pattern
-            if re.search(r"\(formerly\b", text, re.IGNORECASE):
+            if _FORMERLY_RE.search(text):
+                p = Paragraph(p_elem, self.doc._body)
                 self._format_company_title(p)
                 self._enforce_one_blank_row_after(p)
                 
-                # Skip the next blank row
-                i+=1
-                
             # Second line
-            elif "financial statements" in text.lower():
-                p.style = self.doc.styles['Normal']
+            elif "financial statements" in lowered:
+                p = Paragraph(p_elem, self.doc._body)
+                p.style = normal_style
                 p.alignment = WD_ALIGN_PARAGRAPH.CENTER
                 for run in p.runs:
-                    run.font.name = StyleConfig.FONT_NAME
-                    run.font.size = StyleConfig.FONT_SIZE
+                    run.font.name = font_name
+                    run.font.size = font_size
                     run.font.bold = True
                     # Capitalize Each Word
                     run.text = run.text.title() 
                     
                 self._enforce_one_blank_row_after(p)
-                i+=1
                 
             # Third line (period)
-            elif re.search(date_regex, text, re.IGNORECASE):
-                p.style = self.doc.styles['Normal']
+            elif _DATE_RE.search(text):
+                p = Paragraph(p_elem, self.doc._body)
+                p.style = normal_style
                 p.alignment = WD_ALIGN_PARAGRAPH.CENTER
                 for run in p.runs:
                     run.font.bold = True
-                    run.font.name = StyleConfig.FONT_NAME
-                    run.font.size = StyleConfig.FONT_SIZE
+                    run.font.name = font_name
+                    run.font.size = font_size
                     
                 self._enforce_one_blank_row_after(p)
-                i+=1
 
             # Fourth line
-            elif "unaudited" in text.lower() or "expressed in" in text.lower():
-                p.style = self.doc.styles['Normal']
+            elif "unaudited" in lowered or "expressed in" in lowered:
+                p = Paragraph(p_elem, self.doc._body)
+                p.style = normal_style
                 p.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                result = text[0] + text[1].upper() + text[2:]
 
-                p.text = result
-            
+                # Only the second character changes (e.g. "(unaudited" -> "(Unaudited"), so the runs
+                # are edited in place instead of rebuilding the whole paragraph through p.text
+                if len(text) > 1 and text[1].islower():
+                    if not self._capitalize_second_char(p):
+                        p.text = text[0] + text[1].upper() + text[2:]
+
                 for run in p.runs:
-                    run.font.name = StyleConfig.FONT_NAME
-                    run.font.size = StyleConfig.FONT_SIZE
+                    run.font.name = font_name
+                    run.font.size = font_size
                     run.font.bold = False
-            
-            i+=1
\ No newline at end of file
+
+            # The blank row kept after a styled line is visited next and matches none of the rules
+            row += 1
+            p_elem = self._next_paragraph(p_elem)
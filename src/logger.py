@@ -2,8 +2,14 @@ import logging
 import sys
 
 class LevelFormatter(logging.Formatter):
+    # Bracketed level names, built once for the standard levels
+    LEVEL_TAGS = {
+        level: f"[{logging.getLevelName(level)}]"
+        for level in (logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL)
+    }
+
     def format(self, record):
-        record.level = f"[{record.levelname}]"
+        record.level = self.LEVEL_TAGS.get(record.levelno) or f"[{record.levelname}]"
         return super().format(record)
 
 def setup_logging(level: int = logging.INFO) -> logging.Logger:
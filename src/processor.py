@@ -1,11 +1,4 @@
-from docx import Document
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 from src.config import StyleConfig
-from src.header import CoverPageProcessor
-from src.table import TableProcessor
-from src.validator import validate_output
 from pathlib import Path
 import logging
 
@@ -14,12 +7,20 @@ logger = logging.getLogger(__name__)
 def process_document(input_path: Path,
                      output_path: Path,
                      validate: bool = True,
-                     save: bool = True) -> None:
+                     save: bool = True,
+                     fail_fast: bool = False) -> None:
     """
     Core logic to apply styles, headers, and table formatting to a docx file.
     If validation fails, saves the file with a '_WITH_ISSUES' suffix and writes
     a log file.
+    With fail_fast=True, validation stops at the first issue, so only that one is reported.
     """
+    # The processing modules are imported on first use, so importing this module
+    # (CLI start-up, pool workers, test collection) stays cheap
+    from docx import Document
+    from src.header import CoverPageProcessor
+    from src.table import TableProcessor
+    from src.validator import validate_output
     
     # Check if file exists before determining to load it
     if not input_path.exists():
@@ -56,7 +57,7 @@ def process_document(input_path: Path,
     # Optional: Validate the output
     issues = []
     if validate:
-        issues = validate_output(doc)
+        issues = validate_output(doc, fail_fast=fail_fast)
     
     if issues:
         if save:
@@ -74,8 +75,8 @@ def process_document(input_path: Path,
                 for issue in issues:
                     f.write(f"- {issue}\n")
 
-            logger.error(f"Validation FAILED. Output saved to: {issue_doc_path}")
-            logger.error(f"Issue log saved to: {issue_log_path}")
+            logger.error("Validation FAILED. Output saved to: %s", issue_doc_path)
+            logger.error("Issue log saved to: %s", issue_log_path)
             
         return doc, issues
     else:
@@ -1,14 +1,79 @@
-from docx.oxml import OxmlElement
-from docx.oxml.ns import qn
+from docx.oxml import parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.table import _Cell
 import re
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 from src.config import StyleConfig
 from docx.enum.table import WD_ROW_HEIGHT_RULE
+from docx.shared import Emu
 import logging
 logger = logging.getLogger(__name__)
 
+# Compiled once at import time
+_YEAR_RE = re.compile(r'\b(20\d{2})\b')
+_HAS_DATA_RE = re.compile(r'[\d$]')
+
+# Namespace-qualified tags and attributes, resolved once instead of inside the loops
+_W_T = qn('w:t')
+_W_TBL_CELL_MAR = qn('w:tblCellMar')
+
+# Cell margins: 0.05cm (28 dxa) left/right and 0cm top/bottom
+_TBL_CELL_MAR_XML = (
+    f'<w:tblCellMar {nsdecls("w")}>'
+    '<w:left w:w="28" w:type="dxa"/>'
+    '<w:right w:w="28" w:type="dxa"/>'
+    '<w:top w:w="0" w:type="dxa"/>'
+    '<w:bottom w:w="0" w:type="dxa"/>'
+    '</w:tblCellMar>'
+)
+
+# Grid columns based on Config
+# Widths are converted from EMU (python-docx default) to Twips (XML default)
+_TBL_GRID_XML = (
+    f'<w:tblGrid {nsdecls("w")}>'
+    + "".join(f'<w:gridCol w:w="{int(width_emu / 635)}"/>' for width_emu in StyleConfig.TABLE_COLUMN_WIDTHS)
+    + '</w:tblGrid>'
+)
+
+def _tc_text(tc):
+    """
+    Returns the visible text of a <w:tc> element without building python-docx wrappers.
+    """
+    return "".join(t.text or "" for t in tc.iter(_W_T))
+
+def _content_tc(tc, grid_offset):
+    """
+    Returns the <w:tc> element holding the content of a cell.
+    The continuation of a vertically merged cell is followed up to the cell where the merge starts.
+    """
+    while tc.vMerge == "continue":
+        tr_above = tc.getparent().xpath("./preceding-sibling::w:tr[1]")
+        if not tr_above:
+            break
+        try:
+            tc = tr_above[0].tc_at_grid_offset(grid_offset)
+        except ValueError:
+            break
+    return tc
+
+def _iter_grid_cells(tr):
+    """
+    Yields (grid column, <w:tc>) for every layout-grid column a row's cells cover, like row.cells does.
+    A horizontally merged cell is yielded once for each column it spans, and columns skipped at the
+    start of the row (gridBefore) are counted, so the index lines up with the table's grid columns.
+    """
+    col_idx = tr.grid_before
+    for tc in tr.tc_lst:
+        content_tc = _content_tc(tc, col_idx)
+        for _ in range(tc.grid_span):
+            yield col_idx, content_tc
+            col_idx += 1
+
+def _grid_width(tr):
+    """
+    Returns the number of layout-grid columns a row covers, including the ones skipped at its start.
+    """
+    return tr.grid_before + sum(tc.grid_span for tc in tr.tc_lst)
+
 class TableProcessor:
     def __init__(self, doc):
         self.doc = doc
@@ -19,24 +84,13 @@ class TableProcessor:
         """
         tbl_pr = table._tbl.tblPr
         
-        # Create the table cell margin element
-        tbl_cell_mar = OxmlElement('w:tblCellMar')
-        
-        for side in ['left', 'right']:
-            node = OxmlElement(f'w:{side}')
-            node.set(qn('w:w'), "28") 
-            node.set(qn('w:type'), 'dxa')
-            tbl_cell_mar.append(node)
-            
-        for side in ['top', 'bottom']:
-            node = OxmlElement(f'w:{side}')
-            node.set(qn('w:w'), "0")
-            node.set(qn('w:type'), 'dxa')
-            tbl_cell_mar.append(node)
+        # Parse the whole table cell margin element in one go
+        tbl_cell_mar = parse_xml(_TBL_CELL_MAR_XML)
     
         # Remove old margins if they exist and append new ones
-        if tbl_pr.find(qn('w:tblCellMar')) is not None:
-            tbl_pr.remove(tbl_pr.find(qn('w:tblCellMar')))
+        old_cell_mar = tbl_pr.find(_W_TBL_CELL_MAR)
+        if old_cell_mar is not None:
+            tbl_pr.remove(old_cell_mar)
         tbl_pr.append(tbl_cell_mar)
 
     def process(self):
@@ -55,12 +109,12 @@ class TableProcessor:
         # Maps col_index -> datetime object
         dates = {}
 
-        for _, row in enumerate(table.rows[:5]):
-            for col_idx, cell in enumerate(row.cells):
-                text = cell.text.strip()
+        for tr in table._tbl.tr_lst[:5]:
+            for col_idx, tc in _iter_grid_cells(tr):
+                text = _tc_text(tc).strip()
 
                 # Find years like 2023, 2024... 2099
-                match = re.search(r'\b(20\d{2})\b', text)
+                match = _YEAR_RE.search(text)
                 
                 if match:
                     try:
@@ -85,12 +139,12 @@ class TableProcessor:
             logger.warning("Because no current period column was identified, the bolding wasn't applied")
             return
 
-        for row in table.rows:
-            # Skip malformed rows (e.g. merged headers)
-            if current_period_col_idx >= len(row.cells):
+        for tr in table._tbl.tr_lst:
+            # Skip malformed rows (e.g. rows ending before the current period column)
+            if current_period_col_idx >= _grid_width(tr):
                 continue
-                
-            for col_idx, cell in enumerate(row.cells):
+
+            for col_idx, tc in _iter_grid_cells(tr):
                 # Strictly ignore columns 0 and 1.
                 if col_idx < 2:
                     continue
@@ -99,13 +153,11 @@ class TableProcessor:
                 # If this IS NOT the current period column -> Force UN-BOLD
                 should_be_bold = (col_idx == current_period_col_idx)
                 
-                text = cell.text.strip()
-                
                 # Apply only if the cell has the following content -> (numbers, $)
-                has_data = any(c.isdigit() for c in text) or '$' in text
-                
-                if has_data:
-                    for p in cell.paragraphs:
+                # Surrounding whitespace can't match, so the text isn't stripped
+                if _HAS_DATA_RE.search(_tc_text(tc)):
+                    paragraphs = _Cell(tc, table).paragraphs
+                    for p in paragraphs:
                         for run in p.runs:
                             run.font.bold = should_be_bold
 
@@ -117,24 +169,15 @@ class TableProcessor:
         # Access the internal XML element for the table
         tbl = table._tbl
         
-        # Find or Create the 'tblGrid' element
+        # Parse the new grid (with all its columns) in one go
+        new_grid = parse_xml(_TBL_GRID_XML)
+
+        # Replace the existing grid to prevent conflicts, or create it
         tblGrid = tbl.tblGrid
         if tblGrid is None:
-            tblGrid = OxmlElement('w:tblGrid')
-            tbl.insert(0, tblGrid)
+            tbl.insert(0, new_grid)
         else:
-            # Clear existing grid columns to prevent conflicts
-            tblGrid.clear()
-            
-        # Build new grid columns based on Config
-        for width_emu in StyleConfig.TABLE_COLUMN_WIDTHS:
-            gridCol = OxmlElement('w:gridCol')
-            
-            # Convert EMU (python-docx default) to Twips (XML default)
-            width_twips = str(int(width_emu / 635))
-            
-            gridCol.set(qn('w:w'), width_twips)
-            tblGrid.append(gridCol)
+            tbl.replace(tblGrid, new_grid)
                 
     def _apply_structural_rules(self, table):
         """
@@ -145,22 +188,37 @@ class TableProcessor:
 
         self._set_cell_margins(table)
 
-        for row in table.rows:
-            row.height_rule = WD_ROW_HEIGHT_RULE.AT_LEAST
-            row.height = StyleConfig.TABLE_ROW_HEIGHT
+        tr_lst = table._tbl.tr_lst
+
+        # The Grid enforces the column widths. For redundancy, the widths are
+        # also written once per column on the first row's cells only
+        # A merged cell gets the combined width of the grid columns it spans
+        if tr_lst:
+            col_idx = tr_lst[0].grid_before
+            for tc in tr_lst[0].tc_lst:
+                span = tc.grid_span
+                widths = StyleConfig.TABLE_COLUMN_WIDTHS[col_idx:col_idx + span]
+                if widths:
+                    tc.width = Emu(sum(widths))
+                col_idx += span
+
+        for tr in tr_lst:
+            # Write <w:trHeight> directly on the row element
+            tr.trHeight_hRule = WD_ROW_HEIGHT_RULE.AT_LEAST
+            tr.trHeight_val = StyleConfig.TABLE_ROW_HEIGHT
+
+            for idx, tc in enumerate(tr.tc_lst):
+                # Hanging indent only applies to first column cells with text
+                needs_indent = idx == 0 and len(_tc_text(tc).strip()) > 0
+                cell = _Cell(tc, table)
 
-            for idx, cell in enumerate(row.cells):
-                # We still set cell.width for redundancy, though the Grid usually wins
-                if idx < len(StyleConfig.TABLE_COLUMN_WIDTHS):
-                    cell.width = StyleConfig.TABLE_COLUMN_WIDTHS[idx]
-                
                 for paragraph in cell.paragraphs:
                     for run in paragraph.runs:
                         run.font.name = StyleConfig.FONT_NAME
                         run.font.size = StyleConfig.FONT_SIZE
 
                     # Hanging Indent Logic
-                    if idx == 0 and len(cell.text.strip()) > 0:
+                    if needs_indent:
                         paragraph.paragraph_format.left_indent = StyleConfig.TABLE_HANGING_INDENT
                         paragraph.paragraph_format.first_line_indent = -StyleConfig.TABLE_HANGING_INDENT
                         
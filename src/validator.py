@@ -1,49 +1,493 @@
 import logging
-from docx import Document
+import re
+import zipfile
+from collections import namedtuple
+from lxml import etree
 from docx.document import Document as DocumentClass
-from docx.shared import Pt
-from docx.oxml.ns import qn
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from docx.opc.constants import RELATIONSHIP_TYPE as RT
+from docx.shared import Cm, Twips
+from docx.oxml.ns import nsmap, qn
+from docx.oxml.simpletypes import ST_HpsMeasure, ST_SignedTwipsMeasure
 from pathlib import Path
 
-# Configure logging to show distinct PASS/FAIL status
-logging.basicConfig(level=logging.INFO, format='%(message)s')
+# Logging is configured by the application (see setup_logging in src/logger.py),
+# importing the validator doesn't touch the global logging settings
 logger = logging.getLogger("Validator")
+logger.addHandler(logging.NullHandler())
+
+# Expected font sizes as written in <w:sz>, in half-points. Sizes are compared as
+# these raw strings, and only values in another unit (e.g. "9pt") are turned into a Length
+_SZ_9PT = "18"
+_SZ_14PT = "28"
+
+# Start of a sentence case LINE 4, compiled once at import time
+_UNAUDITED_RE = re.compile(r'^\([A-Z][a-z]')
+
+# Namespace-qualified tags of the body items
+_W_BODY = qn('w:body')
+_W_P = qn('w:p')
+_W_TBL = qn('w:tbl')
+
+# Namespace-qualified tags and attributes read by the paragraph checks
+_W_R = qn('w:r')
+_W_HYPERLINK = qn('w:hyperlink')
+_W_T = qn('w:t')
+_W_BR = qn('w:br')
+_W_TYPE = qn('w:type')
+_W_PPR = qn('w:pPr')
+_W_JC = qn('w:jc')
+_W_RPR = qn('w:rPr')
+_W_B = qn('w:b')
+_W_RFONTS = qn('w:rFonts')
+_W_ASCII = qn('w:ascii')
+_W_SZ = qn('w:sz')
+_W_VAL = qn('w:val')
+
+# Text of the other run items, as python-docx reads them (a <w:br> only counts if it's a line break)
+_RUN_ITEM_TEXT = {
+    qn('w:tab'): "\t",
+    qn('w:ptab'): "\t",
+    qn('w:cr'): "\n",
+    qn('w:noBreakHyphen'): "-",
+}
+
+# Values that turn an on/off property like <w:b> off
+_OFF_VALUES = ("0", "false", "off")
+
+# Namespace-qualified tags and attributes read by the table checks, resolved once
+_W_TR = qn('w:tr')
+_W_TC = qn('w:tc')
+_W_TBL_PR = qn('w:tblPr')
+_W_TR_PR = qn('w:trPr')
+_W_TC_PR = qn('w:tcPr')
+_W_GRID_BEFORE = qn('w:gridBefore')
+_W_GRID_SPAN = qn('w:gridSpan')
+_W_CELLMAR = qn('w:tblCellMar')
+_W_LEFT = qn('w:left')
+_W_TOP = qn('w:top')
+_W_W = qn('w:w')
+_W_HANGING = qn('w:hanging')
+_W_FIRST_LINE = qn('w:firstLine')
+
+# Grid columns of a table
+_W_GRID_COL = f"{qn('w:tblGrid')}/{qn('w:gridCol')}"
+
+# Indentation of a cell's first paragraph
+_W_FIRST_P_IND = f"{qn('w:p')}[1]/{qn('w:pPr')}/{qn('w:ind')}"
+
+# The XPath queries are compiled once. They run on the python-docx elements
+# of a loaded document as well as on the plain lxml elements of a streamed one
+_NS = {'w': nsmap['w']}
+
+# Minimum row height of 0.37cm, in twips (1 twip = 635 EMU)
+_MIN_ROW_HEIGHT_TWIPS = Cm(0.37) / 635
+
+# True if any row has no height or a height below the minimum
+_SHORT_ROW = etree.XPath(
+    "boolean(./w:tr[not(w:trPr/w:trHeight/@w:val)"
+    f" or w:trPr/w:trHeight/@w:val < {_MIN_ROW_HEIGHT_TWIPS}])",
+    namespaces=_NS
+)
+
+# Row heights in another unit than twips (e.g. "0.5cm"), which aren't numbers to XPath
+_UNIT_ROW_HEIGHTS = etree.XPath(
+    "./w:tr/w:trPr/w:trHeight/@w:val[number(.) != number(.)]",
+    namespaces=_NS
+)
+
+# First column cell with text in a row below the header
+_FIRST_DATA_CELL = etree.XPath(
+    "(./w:tr[position() > 1]/w:tc[1][.//w:t[normalize-space()]])[1]",
+    namespaces=_NS
+)
+
+# Index of a row in its table
+_ROW_INDEX = etree.XPath("count(preceding-sibling::w:tr)", namespaces=_NS)
+
+# Expected column widths with a 0.1cm tolerance, also in twips
+_EXPECTED_WIDTHS_CM = [11.99, 1.20, 2.30, 2.30]
+_EXPECTED_WIDTHS_TWIPS = [Cm(width) / 635 for width in _EXPECTED_WIDTHS_CM]
+_WIDTH_TOL_TWIPS = Cm(0.1) / 635
+
+# Hanging indent of 0.63cm with a 0.05cm tolerance, in twips (1 twip = 635 EMU)
+_HANGING_TWIPS = Cm(0.63) / 635
+_HANGING_TOL_TWIPS = Cm(0.05) / 635
+
+# Relationships part of the package, which points to the main document part
+_PACKAGE_RELS = "_rels/.rels"
+_PR_RELATIONSHIP = "{http://schemas.openxmlformats.org/package/2006/relationships}Relationship"
+
+# What the checks need from each body paragraph and table. They are collected in
+# document order, so the elements can be freed as soon as they have been read.
+# The font failures are kept apart, since only the last checks need them
+_ParagraphSummary = namedtuple(
+    "_ParagraphSummary",
+    ["text", "is_blank", "centered", "all_bold", "any_bold", "has_size_14"]
+)
+_TableSummary = namedtuple(
+    "_TableSummary",
+    ["rows_pass", "margins", "grid_widths", "hanging"]
+)
+
+def _twips(value):
+    """
+    Returns a twips measure attribute in twips.
+    Plain numbers are read directly, other units (e.g. "0.63cm") are converted as python-docx does.
+    The signed converter also reads every unsigned value.
+    """
+    if value.lstrip("-").isdigit():
+        return int(value)
+    return ST_SignedTwipsMeasure.convert_from_xml(value) / 635
+
+def _indent_twips(ind):
+    """
+    Returns the (left, first line) indentation of a <w:ind> element in twips, 0 when not set.
+    A hanging indent is returned as a negative first line indentation.
+    """
+    if ind is None:
+        return 0, 0
+
+    left = _twips(ind.get(_W_LEFT, "0"))
+    hanging = ind.get(_W_HANGING)
+    if hanging is not None:
+        return left, -_twips(hanging)
+    return left, _twips(ind.get(_W_FIRST_LINE, "0"))
+
+def _is_title_case(text):
+    """
+    Returns True if the text is already in title case (text == text.title()),
+    without building the title-cased copy. Stops at the first character that doesn't match.
+    """
+    previous_is_cased = False
+    for ch in text:
+        # str.title() lower-cases a character that follows a cased one and title-cases any other
+        expected = ch.lower() if previous_is_cased else ch.title()
+        if ch != expected:
+            return False
+        previous_is_cased = ch.isupper() or ch.islower() or ch.istitle()
+    return True
+
+def _run_text(r):
+    """
+    Returns the text of a <w:r> element, the same way python-docx's Run.text reads it.
+    """
+    parts = []
+    for item in r:
+        if item.tag == _W_T:
+            parts.append(item.text or "")
+        elif item.tag == _W_BR:
+            if item.get(_W_TYPE, "textWrapping") == "textWrapping":
+                parts.append("\n")
+        else:
+            parts.append(_RUN_ITEM_TEXT.get(item.tag, ""))
+    return "".join(parts)
+
+def _size_equals(size, expected):
+    """
+    Returns True if a raw <w:sz> value is the expected half-point size.
+    Plain half-point numbers are compared as strings, other units are compared as Lengths.
+    """
+    if size == expected:
+        return True
+    if size is None or size.isdigit():
+        return False
+    return ST_HpsMeasure.convert_from_xml(size) == ST_HpsMeasure.convert_from_xml(expected)
+
+def _run_font(r):
+    """
+    Returns the (bold, name, size) set directly on a <w:r> element, None for the ones that aren't set.
+    The size is the raw <w:sz> value in half-points.
+    Like python-docx's Font, only the run's own <w:rPr> is read, not the styles.
+    """
+    rpr = r.find(_W_RPR)
+    if rpr is None:
+        return None, None, None
+
+    b = rpr.find(_W_B)
+    bold = None if b is None else b.get(_W_VAL, "true") not in _OFF_VALUES
+
+    rfonts = rpr.find(_W_RFONTS)
+    name = None if rfonts is None else rfonts.get(_W_ASCII)
+
+    sz = rpr.find(_W_SZ)
+    size = None if sz is None else sz.get(_W_VAL)
+
+    return bold, name, size
+
+def _is_body_font(name, size):
+    """
+    Returns True if a run's font is Arial 9pt (or Arial without a size of its own).
+    """
+    return name == "Arial" and (size is None or _size_equals(size, _SZ_9PT))
+
+def _summarize_paragraph(p, fonts=None):
+    """
+    Reads everything the checks need from a <w:p> element in one pass over its runs,
+    including whether it's a blank row (no run with visible text).
+    The text also includes hyperlinks, while the style checks only look at the paragraph's own runs.
+    If a list is given as fonts, the paragraph's font failure is added to it in the same pass.
+    """
+    text_parts = []
+    is_blank = True
+    all_bold = True
+    any_bold = False
+    has_size_14 = False
+    font_issue = None
+
+    for item in p:
+        if item.tag == _W_R:
+            run_text = _run_text(item)
+            text_parts.append(run_text)
+            bold, name, size = _run_font(item)
+
+            has_text = bool(run_text.strip())
+            if has_text:
+                is_blank = False
+            if has_text and not bold:
+                all_bold = False
+            if bold:
+                any_bold = True
+            if _size_equals(size, _SZ_14PT):
+                has_size_14 = True
+
+            # First run with text that isn't Arial 9pt
+            if fonts is not None and font_issue is None and has_text and not _is_body_font(name, size):
+                font_issue = (name, size)
+
+        elif item.tag == _W_HYPERLINK:
+            for r in item.iterchildren(_W_R):
+                run_text = _run_text(r)
+                text_parts.append(run_text)
+                if run_text.strip():
+                    is_blank = False
+
+    ppr = p.find(_W_PPR)
+    jc = None if ppr is None else ppr.find(_W_JC)
+    centered = jc is not None and jc.get(_W_VAL) == "center"
+
+    if fonts is not None:
+        fonts.append(font_issue)
+
+    return _ParagraphSummary(
+        "".join(text_parts), is_blank, centered, all_bold, any_bold, has_size_14
+    )
+
+def _paragraph_font_issue(p):
+    """
+    Returns the (name, size) of the first run with text in a <w:p> element that isn't Arial 9pt,
+    or None if there isn't one. A run's text is only read once its font turned out to be wrong.
+    """
+    for r in p.iterchildren(_W_R):
+        _, name, size = _run_font(r)
+        if not _is_body_font(name, size) and _run_text(r).strip():
+            return name, size
+    return None
+
+def _font_values(font_issue):
+    """
+    Returns the font name and size of a font issue, as they are shown in the messages.
+    """
+    name, size = font_issue
+    actual_name = name if name else "None (Inherited)"
+
+    # A size of 0 is shown as inherited, like a missing one
+    length = ST_HpsMeasure.convert_from_xml(size) if size is not None else None
+    actual_size = length.pt if length else "None (Inherited)"
+    return actual_name, actual_size
+
+def _grid_offset(tc):
+    """
+    Returns the grid column a <w:tc> element starts at, counting merged cells and skipped grid columns.
+    """
+    tr_pr = tc.getparent().find(_W_TR_PR)
+    grid_before = None if tr_pr is None else tr_pr.find(_W_GRID_BEFORE)
+    offset = 0 if grid_before is None else int(grid_before.get(_W_VAL))
+
+    for sibling in tc.itersiblings(_W_TC, preceding=True):
+        tc_pr = sibling.find(_W_TC_PR)
+        grid_span = None if tc_pr is None else tc_pr.find(_W_GRID_SPAN)
+        offset += 1 if grid_span is None else int(grid_span.get(_W_VAL))
+
+    return offset
+
+def _summarize_table(tbl):
+    """
+    Reads everything the checks need from a <w:tbl> element.
+    """
+    # A single XPath query finds any row without a height or below 0.37cm,
+    # only heights written in another unit are converted here
+    rows_pass = not _SHORT_ROW(tbl) and all(
+        _twips(height) >= _MIN_ROW_HEIGHT_TWIPS for height in _UNIT_ROW_HEIGHTS(tbl)
+    )
+
+    # Cell margins: None if not set, otherwise whether they match 28 dxa (approx 0.05cm) L and 0 T
+    tbl_pr = tbl.find(_W_TBL_PR)
+    mar = None if tbl_pr is None else tbl_pr.find(_W_CELLMAR)
+    if mar is None:
+        margins = None
+    else:
+        left = mar.find(_W_LEFT)
+        top = mar.find(_W_TOP)
+        margins = left is not None and left.get(_W_W) == '28' and top is not None and top.get(_W_W) == '0'
+
+    # The widths Word enforces are read from the table grid, in twips
+    grid_widths = [_twips(col.get(_W_W, "0")) for col in tbl.iterfind(_W_GRID_COL)]
+
+    # The first cell with text below the header row is found with one XPath query,
+    # and its (row, left, first line) indentation is read straight from <w:ind> in twips
+    data_cells = _FIRST_DATA_CELL(tbl)
+    if data_cells:
+        tc = data_cells[0]
+        hanging = (int(_ROW_INDEX(tc.getparent())), *_indent_twips(tc.find(_W_FIRST_P_IND)))
+    else:
+        hanging = None
+
+    return _TableSummary(rows_pass, margins, grid_widths, hanging)
+
+def _table_font_issues(tbl):
+    """
+    Returns the font failures in the cells of a <w:tbl> element as (row, column, name, size, preview).
+    """
+    font_issues = []
+    seen = set()
+
+    for r_idx, tr in enumerate(tbl.iterchildren(_W_TR)):
+        for tc in tr.iterchildren(_W_TC):
+            for p in tc.iterchildren(_W_P):
+                font_issue = _paragraph_font_issue(p)
+                if font_issue is None:
+                    continue
+
+                actual_name, actual_size = _font_values(font_issue)
+
+                # The cell's grid column is only worked out for the failures that are reported
+                col_idx = _grid_offset(tc)
+
+                # A cell is reported once per wrong font, however many of its paragraphs use it
+                key = (r_idx, col_idx, actual_name, actual_size)
+                if key in seen:
+                    continue
+                seen.add(key)
+
+                text = _summarize_paragraph(p).text
+                preview = (text[:20] + '...') if len(text) > 20 else text
+                font_issues.append((r_idx, col_idx, actual_name, actual_size, preview))
+
+    return font_issues
+
+def _block_fonts(block):
+    """
+    Returns the font failure of a body paragraph, or the list of font failures of a table.
+    """
+    return _paragraph_font_issue(block) if block.tag == _W_P else _table_font_issues(block)
+
+def _summarize_blocks(blocks, fonts=None):
+    """
+    Returns the summaries of the body's paragraphs and tables, in document order.
+    If a list is given as fonts, the font failures of each block are added to it in the same pass.
+    """
+    summaries = []
+    for block in blocks:
+        if block.tag == _W_P:
+            summaries.append(_summarize_paragraph(block, fonts))
+        else:
+            summaries.append(_summarize_table(block))
+            if fonts is not None:
+                fonts.append(_table_font_issues(block))
+    return summaries
+
+def _main_part_name(package):
+    """
+    Returns the name of the main document part (usually word/document.xml) inside a .docx zip.
+    """
+    rels = etree.fromstring(package.read(_PACKAGE_RELS))
+    for rel in rels.iter(_PR_RELATIONSHIP):
+        if rel.get("Type") == RT.OFFICE_DOCUMENT:
+            return rel.get("Target").lstrip("/")
+    raise KeyError("The package has no main document part.")
+
+def _iter_package_blocks(path):
+    """
+    Streams the body paragraphs and tables of a .docx file, without loading the whole document.
+    Each block is freed, together with anything skipped before it, once the caller has read it.
+    """
+    with zipfile.ZipFile(path) as package:
+        with package.open(_main_part_name(package)) as part:
+            # Parsed with the same options python-docx uses
+            events = etree.iterparse(
+                part, events=("end",), tag=(_W_P, _W_TBL),
+                remove_blank_text=True, resolve_entities=False
+            )
+            for _, elem in events:
+                # Paragraphs and tables nested in tables (or other blocks) are read with their parent
+                parent = elem.getparent()
+                if parent is None or parent.tag != _W_BODY:
+                    continue
+
+                yield elem
 
-def validate_output(doc_or_path):
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del parent[0]
+
+def validate_output(doc_or_path, fail_fast=False):
     """
     Validates a processed .docx file against specific style guide rules.
+    With fail_fast=True it returns as soon as the first issue is found,
+    for callers that only need to know whether the document passed.
     """
 
     issues = []
 
+    # Records an issue, and returns True if the validation should stop there
+    def fail(message, level=logging.WARNING):
+        logger.log(level, message)
+        issues.append(message)
+        return fail_fast
+
+    # The font checks come last and read every run of the document. A full run always
+    # reaches them, so the font failures are read in the same pass as the summaries.
+    # With fail_fast they are only worked out if the validation gets that far
+    fonts = None if fail_fast else []
+
     if isinstance(doc_or_path, (str, Path)):
+        # The document.xml part is streamed straight from the file,
+        # keeping only a short summary of each paragraph and table
+        path = str(doc_or_path)
         try:
-            doc = Document(str(doc_or_path))
+            blocks = _summarize_blocks(_iter_package_blocks(path), fonts)
         except Exception as e:
-            message = f"Could not load document. {e}"
-            logger.error(message)
-            issues.append(message)
+            fail(f"Could not load document. {e}", logging.ERROR)
             return issues
 
+        # With fail_fast the file is only streamed again if the font checks are reached
+        body_blocks = _iter_package_blocks(path)
+
     elif isinstance(doc_or_path, DocumentClass):
-        doc = doc_or_path
+        # A loaded document is already in memory, so its body is read in place
+        body_blocks = list(doc_or_path.element.body.iterchildren(_W_P, _W_TBL))
+        blocks = _summarize_blocks(body_blocks, fonts)
 
     else:
         message = (
             "The argument 'doc_or_path' must be either a path to a .docx file "
             f"or a python-docx Document object. Got {type(doc_or_path)}"
         )
-        logger.error(message)
-        issues.append(message)
+        fail(message, logging.ERROR)
         return issues
 
     logger.info("Starting Validation\n")
+
+    paragraphs = [block for block in blocks if isinstance(block, _ParagraphSummary)]
+    tables = [block for block in blocks if isinstance(block, _TableSummary)]
+
+    # Blank rows were worked out while reading the runs and are shared by every check below
+    is_blank = [p.is_blank for p in paragraphs]
     
     # Helper to find the next non-empty paragraph (text)
     def get_next_content_node(start_index, paragraphs):
         for i in range(start_index, len(paragraphs)):
-            if paragraphs[i].text.strip():
+            if not is_blank[i]:
                 return i, paragraphs[i]
         return -1, None
 
@@ -51,22 +495,22 @@ def validate_output(doc_or_path):
     logger.info("Section 1: Cover Page\n")
     
     # Find the first line (Title)
-    title_index, title_p = get_next_content_node(0, doc.paragraphs)
+    title_index, title_p = get_next_content_node(0, paragraphs)
     
     # Check: Start Row (Row 19) [Rule: 17]
     if title_index >= 0 and title_index == 18:
         logger.info("[PASS] Cover page text starts on Row 19.")
     else:
         message = f"[FAIL] Cover page text starts on Row {title_index + 1} (Expected: 19)."
-        logger.warning(message)
-        issues.append(message)
+        if fail(message):
+            return issues
 
     # Check: Company Title Style [Rules: 20, 21]
     # Requirements: Bold, Size 14, Centered
     if title_p:
-        is_bold = all(run.font.bold for run in title_p.runs if run.text.strip())
-        is_size_14 = any(run.font.size == Pt(14) for run in title_p.runs if run.font.size)
-        is_centered = title_p.alignment == WD_ALIGN_PARAGRAPH.CENTER
+        is_bold = title_p.all_bold
+        is_size_14 = title_p.has_size_14
+        is_centered = title_p.centered
         
         if is_bold and is_size_14 and is_centered:
             logger.info("[PASS] LINE 1 (Title): Correctly Bold, Size 14, and Centered.")
@@ -75,65 +519,63 @@ def validate_output(doc_or_path):
                 f"[FAIL] LINE 1 (Title): Style mismatch. Bold: {is_bold}, "
                 f"Size 14: {is_size_14}, Centered: {is_centered}"
             )
-            logger.warning(message)
-            issues.append(message)
+            if fail(message):
+                return issues
 
         # Check 3: Blank Row After Title [Rule: 25]
-        if title_index + 1 < len(doc.paragraphs) and not doc.paragraphs[title_index + 1].text.strip():
+        if title_index + 1 < len(is_blank) and is_blank[title_index + 1]:
             logger.info("[PASS] Blank row exists after Title.")
         else:
             message = "[FAIL] Missing blank row after Title."
-            logger.warning(message)
-            issues.append(message)
+            if fail(message):
+                return issues
     else:
-        message = "CRITICAL: No text found on cover page."
-        logger.error(message)
-        issues.append(message)
+        fail("CRITICAL: No text found on cover page.", logging.ERROR)
         return issues
 
     # Find Second Line (Financial Statements)
     # Start searching after the title + blank row
-    stmts_index, stmts_p = get_next_content_node(title_index + 1, doc.paragraphs)
+    stmts_index, stmts_p = get_next_content_node(title_index + 1, paragraphs)
 
     # Check: Financial Statements Style [Rule: 26]
     # Requirements: Bold, Capitalize Each Word, Centered
     if stmts_p:
         text = stmts_p.text.strip()
-        is_bold = any(run.font.bold for run in stmts_p.runs)
-        is_title_case = text == text.title()
+        is_bold = stmts_p.any_bold
+        is_title_case = _is_title_case(text)
         
         if "financial statements" in text.lower():
             if is_bold and is_title_case:
                 logger.info("[PASS] LINE 2: '%s' is Bold and Title Case.", text)
             else:
                 message = f"[FAIL] LINE 2: '{text}' style mismatch. Bold: {is_bold}, Title Case: {is_title_case}"
-                logger.warning(message)
-                issues.append(message)
+                if fail(message):
+                    return issues
         else:
             message = f"[FAIL] LINE 2: Expected 'Financial Statements', found '{text}'." 
-            logger.warning(message)
-            issues.append(message)
+            if fail(message):
+                return issues
 
         # Check: Blank Row After [Rule: 27]
-        if stmts_index + 1 < len(doc.paragraphs) and not doc.paragraphs[stmts_index + 1].text.strip():
+        if stmts_index + 1 < len(is_blank) and is_blank[stmts_index + 1]:
              logger.info("[PASS] Blank row exists after Financial Statements.")
         else:
              message = "[FAIL] Missing blank row after Financial Statements."
-             logger.warning(message)
-             issues.append(message)
+             if fail(message):
+                 return issues
     else:
         message = "[FAIL] LINE 2 missing."
-        logger.warning(message)
-        issues.append(message)
+        if fail(message):
+            return issues
 
     # Find Third Line (Period Reference)
-    period_index, period_p = get_next_content_node(stmts_index + 1, doc.paragraphs)
+    period_index, period_p = get_next_content_node(stmts_index + 1, paragraphs)
 
     # Check: Period Reference Style [Rule: 28]
     # Requirements: Bold, Sentence case (only first letter cap)
     if period_p:
         text = period_p.text.strip()
-        is_bold = any(run.font.bold for run in period_p.runs)
+        is_bold = period_p.any_bold
         
         # Check if not CAPS
         is_not_all_caps = not text.isupper() 
@@ -142,23 +584,23 @@ def validate_output(doc_or_path):
              logger.info("[PASS] LINE 3: '%s' is Bold.", text)
         else:
              message = f"[FAIL] LINE 3: '{text}' style mismatch. Bold: {is_bold}, Caps Check: {is_not_all_caps}"
-             logger.warning(message)
-             issues.append(message)
+             if fail(message):
+                 return issues
 
         # Check: Blank Row After [Rule: 29]
-        if period_index + 1 < len(doc.paragraphs) and not doc.paragraphs[period_index + 1].text.strip():
+        if period_index + 1 < len(is_blank) and is_blank[period_index + 1]:
              logger.info("[PASS] Blank row exists after Period Reference.")
         else:
              message = "[FAIL] Missing blank row after Period Reference."
-             logger.warning(message)
-             issues.append(message)
+             if fail(message):
+                 return issues
     else:
         message = "[FAIL] LINE 3 missing."
-        logger.warning(message)
-        issues.append(message)
+        if fail(message):
+            return issues
 
     # Find Fourth Line (Unaudited)
-    _, unaudited_p = get_next_content_node(period_index + 1, doc.paragraphs)
+    _, unaudited_p = get_next_content_node(period_index + 1, paragraphs)
 
     # Check: Unaudited Style [Rule: 30]
     # Requirements: Sentence case, NOT Bold (implied standard font), Centered
@@ -168,16 +610,14 @@ def validate_output(doc_or_path):
         # Check for "(Unaudited...)"
         if ("unaudited" in text.lower()) or ("expressed" in text.lower()):
             # Check Bold (Should be False)
-            is_bold = any(run.font.bold for run in unaudited_p.runs)
+            is_bold = unaudited_p.any_bold
             
             # Needs clarification here
             # Flexible check: ensure it's not ALL CAPS or Title Case
             clean_text = text.strip()
+            # "(" followed by an upper and a lower case letter, e.g. "(Unaudited"
             is_sentence_ish = (
-                clean_text.startswith("(")
-                and len(clean_text) > 2
-                and clean_text[1].isupper()
-                and clean_text[2].islower()
+                _UNAUDITED_RE.match(clean_text) is not None
                 and not clean_text.istitle() 
             )
 
@@ -185,126 +625,92 @@ def validate_output(doc_or_path):
                 logger.info("[PASS] LINE 4: '%s' is Un-bolded and Sentence Case.\n", text)
             else:
                 message = f"[FAIL] LINE 4: '{text}' style mismatch. Bold: {is_bold} (Should be False).\n"
-                logger.warning(message)
-                issues.append(message)
+                if fail(message):
+                    return issues
         else:
             message = f"[FAIL] LINE 4: Expected 'Unaudited...' or 'Expressed...', found '{text}'.\n" 
-            logger.warning(message)
-            issues.append(message)
+            if fail(message):
+                return issues
     else:
         message = "[FAIL] LINE 4 missing.\n"
-        logger.warning(message)
-        issues.append(message)
+        if fail(message):
+            return issues
 
     # --- Section 2: Table Validation ---
     logger.info("Section 2: Tables\n")
     
-    if not doc.tables:
+    if not tables:
         message = "No tables found in document."
-        logger.warning(message)
-        issues.append(message)
+        if fail(message):
+            return issues
 
-    for t_idx, table in enumerate(doc.tables):
+    for t_idx, table in enumerate(tables):
         logger.info("Checking Table %s...", t_idx + 1)
 
         # Check: Row Height (Rule: At least 0.37cm) [Rule: 32]
-        rows_pass = True
-        for row in table.rows:
-            if row.height is None or row.height.cm < 0.37:
-                rows_pass = False
-                break
-        
-        if rows_pass:
+        if table.rows_pass:
             logger.info("   [PASS] Row heights are at least 0.37cm.")
         else:
             message = "   [FAIL] One or more rows have incorrect height."
-            logger.warning(message)
-            issues.append(message)
+            if fail(message):
+                return issues
 
         # Check: Cell Margins (Rule: L/R 0.05cm, T/B 0.0cm) 
-        tbl_pr = table._tbl.tblPr
-        mar = tbl_pr.find(qn('w:tblCellMar'))
-        if mar is not None:
-            left = mar.find(qn('w:left'))
-            top = mar.find(qn('w:top'))
-            
-            # 28 dxa is approx 0.05cm
-            if left is not None and left.get(qn('w:w')) == '28' and top is not None and top.get(qn('w:w')) == '0':
+        if table.margins is not None:
+            if table.margins:
                  logger.info("   [PASS] Cell margins are set correctly (0.05cm L/R, 0cm T/B).")
             else:
                  message = "   [FAIL] Cell margins in XML do not match expected values."
-                 logger.warning(message)
-                 issues.append(message)
+                 if fail(message):
+                     return issues
         else:
             message = "   [FAIL] No custom cell margins found in XML."
-            logger.warning(message)
-            issues.append(message)
+            if fail(message):
+                return issues
 
         # Check: Column Widths [Rules: 34, 37]
-        # Expected: ~11.99cm, ~1.20cm, ~2.30cm (converted to Twips or EMUs)
-        # 1 cm = 360000 EMU. 
-        expected_widths = [11.99, 1.20, 2.30, 2.30]
-        
-        # Check the first row's cells
+        # Expected: ~11.99cm, ~1.20cm, ~2.30cm
         width_pass = True
-        first_row_cells = table.rows[0].cells
-        for i, expected in enumerate(expected_widths):
-            if i < len(first_row_cells):
+        grid_widths = table.grid_widths
+        for i, (expected, expected_twips) in enumerate(zip(_EXPECTED_WIDTHS_CM, _EXPECTED_WIDTHS_TWIPS)):
+            if i < len(grid_widths):
                 # Allow small tolerance for floating point conversion
-                cell_width_cm = first_row_cells[i].width.cm
-                if abs(cell_width_cm - expected) > 0.1: 
+                col_twips = grid_widths[i]
+                if abs(col_twips - expected_twips) > _WIDTH_TOL_TWIPS:
                     width_pass = False
-                    message = f"   [FAIL] Col {i} width mismatch. Found {round(cell_width_cm, 2)}cm, Expected {expected}cm."
-                    logger.warning(message)
-                    issues.append(message)
+                    message = f"   [FAIL] Col {i} width mismatch. Found {round(Twips(col_twips).cm, 2)}cm, Expected {expected}cm."
+                    if fail(message):
+                        return issues
         
         if width_pass:
             logger.info("   [PASS] Column widths match specifications.")
 
         # Check: Hanging Indent (Rule: 0.63cm) [Rule: 35]
-        hanging_passed = False
-        checked_row = -1
-        
-        for r_idx, row in enumerate(table.rows):
-            # Skip header (row 0)
-            if r_idx == 0:
-                continue
-                
-            cell = row.cells[0]
-            # Must have text to have indent
-            if cell.text.strip(): 
-                p = cell.paragraphs[0]
-                fmt = p.paragraph_format
-                
-                # Check if values exist
-                left_val = fmt.left_indent.cm if fmt.left_indent else 0.0
-                first_line_val = fmt.first_line_indent.cm if fmt.first_line_indent else 0.0
-                
-                # Verify 0.63cm hanging (Left +0.63, First Line -0.63)
-                if (abs(left_val - 0.63) < 0.05 and abs(first_line_val + 0.63) < 0.05):
-                    hanging_passed = True
-                    checked_row = r_idx
-                    break 
-                else:
-                    # Capture the failure details for the log
-                    checked_row = r_idx
-                    break 
+        if table.hanging is not None:
+            checked_row, left_twips, first_line_twips = table.hanging
+
+            # Verify 0.63cm hanging (Left +0.63, First Line -0.63)
+            hanging_passed = (
+                abs(left_twips - _HANGING_TWIPS) < _HANGING_TOL_TWIPS
+                and abs(first_line_twips + _HANGING_TWIPS) < _HANGING_TOL_TWIPS
+            )
+        else:
+            hanging_passed = False
+            checked_row = -1
 
         if hanging_passed:
-             logger.info(f"   [PASS] Hanging indent detected in Row {checked_row+1}, Col 1.\n")
+             logger.info("   [PASS] Hanging indent detected in Row %s, Col 1.\n", checked_row + 1)
         elif checked_row != -1:
              # We found a text row, but it had wrong indentation
-             p = table.rows[checked_row].cells[0].paragraphs[0]
-             fmt = p.paragraph_format
-             l_val = fmt.left_indent.cm if fmt.left_indent else "None"
-             fl_val = fmt.first_line_indent.cm if fmt.first_line_indent else "None"
+             l_val = Twips(left_twips).cm if left_twips else "None"
+             fl_val = Twips(first_line_twips).cm if first_line_twips else "None"
              
              message = (
                  f"   [FAIL] Hanging indent mismatch in Row {checked_row+1}. "
                  f"Found Left={l_val}, FirstLine={fl_val}. Expected Left=0.63, FirstLine=-0.63.\n"
              )
-             logger.warning(message)
-             issues.append(message)
+             if fail(message):
+                 return issues
         else:
              # We never found a row with text
              logger.warning("   [SKIP] Could not validate hanging indent (No data rows found in Col 1).\n")
@@ -314,83 +720,55 @@ def validate_output(doc_or_path):
     
     font_issues_found = False
 
-    for i, p in enumerate(doc.paragraphs):
+    # Body paragraphs and table cells are reported in document order
+    para_idx = -1
+    t_idx = -1
 
-        # Skip the Title (Arial 14)
-        if i == title_index:
-            continue
-            
-        # Skip blank rows
-        if not p.text.strip():
-            continue
-
-        # Check every 'run' in the paragraph
-        for run in p.runs:
-            # Skip runs without text
-            if not run.text.strip():
+    # With fail_fast the font failures are only read now that the checks got this far
+    if fonts is None:
+        fonts = [_block_fonts(block) for block in body_blocks]
+
+    for block, block_fonts in zip(blocks, fonts):
+        if isinstance(block, _ParagraphSummary):
+            para_idx += 1
+
+            # Skip the Title (Arial 14)
+            if para_idx == title_index:
                 continue
 
-            # Check Font Name: Must be "Arial"
-            name_bad = (run.font.name != "Arial")
-            
-            # Check Font Size: Must be 9pt (if explicitly set)
-            size_bad = (run.font.size is not None and run.font.size != Pt(9))
-            if name_bad or size_bad:
+            if block_fonts is not None:
                 font_issues_found = True
-                
-                actual_name = run.font.name if run.font.name else "None (Inherited)"
-                actual_size = run.font.size.pt if run.font.size else "None (Inherited)"
-                
+                actual_name, actual_size = _font_values(block_fonts)
+
                 # Truncate text for cleaner logs
-                preview = (p.text[:30] + '...') if len(p.text) > 30 else p.text
-                
+                text = block.text
+                preview = (text[:30] + '...') if len(text) > 30 else text
+
                 message = (
-                    f"   [FAIL] Font Issue in Para {i+1} ('{preview}'): "
+                    f"   [FAIL] Font Issue in Para {para_idx+1} ('{preview}'): "
                     f"Name='{actual_name}', Size={actual_size}. Expected Arial 9pt."
                 )
-                logger.warning(message)
-                issues.append(message)
-                
-                # Stop checking runs in this paragraph to avoid spam
-                break
-
-    # Check table
-    for t_idx, table in enumerate(doc.tables):
-        for r_idx, row in enumerate(table.rows):
-            for c_idx, cell in enumerate(row.cells):
-                for p in cell.paragraphs:
-                    
-                    if not p.text.strip():
-                        continue
-
-                    for run in p.runs:
-                        if not run.text.strip():
-                            continue
-                        name_bad = (run.font.name != "Arial")
-                        size_bad = (run.font.size is not None and run.font.size != Pt(9))
-
-                        if name_bad or size_bad:
-                            print("HIMA PROBLEM CHKA?")
-                            font_issues_found = True
-                            actual_name = run.font.name if run.font.name else "None (Inherited)"
-                            actual_size = run.font.size.pt if run.font.size else "None (Inherited)"
-                            preview = (p.text[:20] + '...') if len(p.text) > 20 else p.text
-                            
-                            message = (
-                                f"   [FAIL] Table Font Issue (Table {t_idx+1}, Row {r_idx+1}, Col {c_idx+1}): "
-                                f"'{preview}' -> Name='{actual_name}', Size={actual_size}."
-                            )
-                            logger.warning(message)
-                            issues.append(message)
-                            
-                            break
+                if fail(message):
+                    return issues
+
+        else:
+            t_idx += 1
+
+            for r_idx, col_idx, actual_name, actual_size, preview in block_fonts:
+                font_issues_found = True
+                message = (
+                    f"   [FAIL] Table Font Issue (Table {t_idx+1}, Row {r_idx+1}, Col {col_idx+1}): "
+                    f"'{preview}' -> Name='{actual_name}', Size={actual_size}."
+                )
+                if fail(message):
+                    return issues
 
     if not font_issues_found:
         logger.info("[PASS] Body font appears to be Arial 9pt.\n")
     else:
         message = "[FAIL] Body font is not Arial 9pt.\n"
-        logger.warning(message)
-        issues.append(message)
+        if fail(message):
+            return issues
 
     logger.info("VALIDATION COMPLETE\n")
 
@@ -0,0 +1,80 @@
+import io
+import logging
+import tempfile
+import zipfile
+import pytest
+from pathlib import Path
+
+from docx import Document
+from fastapi.testclient import TestClient
+from main import app
+
+TEST_INPUTS_DIR = Path(__file__).parent / "inputs"
+
+@pytest.fixture(scope="module")
+def client():
+    """
+    A test client with the app's lifespan (process pool and result cache) running.
+    """
+    with TestClient(app) as test_client:
+        yield test_client
+
+def read_input(name):
+    return (TEST_INPUTS_DIR / name).read_bytes()
+
+def open_archive(response):
+    return zipfile.ZipFile(io.BytesIO(response.content))
+
+def test_batch_returns_processed_documents(client):
+    response = client.post("/process-documents/", files=[
+        ("files", ("input1.docx", read_input("input1.docx"))),
+        ("files", ("input2.docx", read_input("input2.docx"))),
+    ])
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/zip"
+    assert sorted(open_archive(response).namelist()) == ["processed_input1.docx", "processed_input2.docx"]
+
+def test_batch_keeps_uploads_with_the_same_name(client):
+    response = client.post("/process-documents/", files=[
+        ("files", ("report.docx", read_input("input1.docx"))),
+        ("files", ("report.docx", read_input("input2.docx"))),
+    ])
+
+    assert response.status_code == 200
+    assert sorted(open_archive(response).namelist()) == ["processed_report.docx", "processed_report_2.docx"]
+
+def test_batch_reports_a_bad_file_without_failing_the_others(client):
+    response = client.post("/process-documents/", files=[
+        ("files", ("good.docx", read_input("input3.docx"))),
+        ("files", ("bad.docx", b"not a docx file")),
+    ])
+
+    assert response.status_code == 200
+    archive = open_archive(response)
+    assert sorted(archive.namelist()) == ["errors.txt", "processed_good.docx"]
+    assert archive.read("errors.txt").decode().startswith("bad.docx: Processing failed.")
+
+def test_single_returns_validation_issues_and_cleans_up(client, tmp_path, monkeypatch):
+    # Route the per-request work directory into tmp_path so leftovers are easy to spot
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    blank = io.BytesIO()
+    Document().save(blank)
+
+    response = client.post("/process-document/", files={"file": ("blank.docx", blank.getvalue())})
+
+    assert response.status_code == 422
+    assert "CRITICAL: No text found on cover page." in response.json()["detail"]["issues"]
+    assert list(tmp_path.iterdir()) == []
+
+def test_single_serves_identical_upload_from_cache(client, caplog):
+    content = read_input("input4.docx")
+
+    first = client.post("/process-document/", files={"file": ("input4.docx", content)})
+    with caplog.at_level(logging.INFO, logger="API"):
+        second = client.post("/process-document/", files={"file": ("input4.docx", content)})
+
+    assert first.status_code == second.status_code == 200
+    assert second.content == first.content
+    assert "Serving cached result for: input4.docx" in caplog.messages
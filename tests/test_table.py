@@ -0,0 +1,73 @@
+from docx import Document
+from docx.oxml import OxmlElement
+from docx.oxml.ns import qn
+from docx.table import _Cell
+from src.config import StyleConfig
+from src.table import TableProcessor
+
+def make_statement_table(doc, header_years=("2024", "2023"), values=("100", "90")):
+    """
+    Adds a 4-column statement table whose first two header cells are merged into one.
+    """
+    table = doc.add_table(rows=2, cols=4)
+
+    header = table.rows[0].cells
+    header[0].merge(header[1])
+    header[2].text, header[3].text = header_years
+
+    row = table.rows[1].cells
+    row[0].text = "Revenue"
+    row[2].text, row[3].text = values
+
+    return table
+
+def is_bold(cell):
+    return all(run.font.bold for p in cell.paragraphs for run in p.runs)
+
+def test_merged_header_bolds_current_period_column():
+    """
+    A merged header cell spans two grid columns, so the years still sit in columns 2 and 3.
+    """
+    doc = Document()
+    table = make_statement_table(doc)
+
+    TableProcessor(doc).process()
+
+    cells = table.rows[1].cells
+    assert is_bold(cells[2])
+    assert not is_bold(cells[3])
+
+def test_row_starting_after_first_column_keeps_grid_columns():
+    """
+    A row that skips its first grid column (gridBefore) still lines its values up with the header years.
+    """
+    doc = Document()
+    table = make_statement_table(doc)
+
+    # Drop the first cell of the data row and mark its grid column as skipped instead
+    tr = table.rows[1]._tr
+    tr.remove(tr.tc_lst[0])
+    grid_before = OxmlElement("w:gridBefore")
+    grid_before.set(qn("w:val"), "1")
+    tr.get_or_add_trPr().append(grid_before)
+
+    TableProcessor(doc).process()
+
+    tc_lst = tr.tc_lst
+    assert is_bold(_Cell(tc_lst[1], table))
+    assert not is_bold(_Cell(tc_lst[2], table))
+
+def test_merged_header_cell_gets_the_width_of_its_columns():
+    """
+    The widths written on the first row follow the grid columns each cell spans.
+    """
+    doc = Document()
+    table = make_statement_table(doc)
+
+    TableProcessor(doc).process()
+
+    widths = StyleConfig.TABLE_COLUMN_WIDTHS
+    tc_lst = table.rows[0]._tr.tc_lst
+    assert abs(tc_lst[0].width - (widths[0] + widths[1])) < 635
+    assert abs(tc_lst[1].width - widths[2]) < 635
+    assert abs(tc_lst[2].width - widths[3]) < 635
@@ -0,0 +1,212 @@
+import copy
+import pytest
+from pathlib import Path
+
+from docx import Document
+from docx.oxml import OxmlElement, parse_xml
+from docx.oxml.ns import nsdecls, qn
+from docx.table import _Cell
+from src.processor import process_document
+from src.validator import validate_output
+
+TEST_INPUTS_DIR = Path(__file__).parent / "inputs"
+INPUT_FILES = sorted(
+    path for path in TEST_INPUTS_DIR.glob("*.docx")
+    if not path.name.endswith("_processed.docx")
+)
+
+def processed_document(input_path, output_path):
+    """
+    Formats an input without validating or saving it, so the test can edit and save it.
+    """
+    doc, _ = process_document(input_path, output_path, validate=False, save=False)
+    return doc
+
+def text_paragraphs(doc):
+    return [p for p in doc.paragraphs if p.text.strip()]
+
+def use_courier(cell):
+    """
+    Gives the cell's runs a wrong font, so its grid column shows up in the font issues.
+    """
+    for p in cell.paragraphs:
+        for run in p.runs:
+            run.font.name = "Courier New"
+
+def add_hyperlink(doc):
+    # The hyperlink's text counts towards LINE 2, which is then no longer in title case
+    text_paragraphs(doc)[1]._p.append(parse_xml(
+        f'<w:hyperlink {nsdecls("w", "r")} r:id="rId999">'
+        '<w:r><w:t> (see notes)</w:t></w:r>'
+        '</w:hyperlink>'
+    ))
+
+def add_breaks(doc):
+    paragraph = doc.add_paragraph("Before")
+    paragraph._p.append(parse_xml(
+        f'<w:r {nsdecls("w")}>'
+        '<w:tab/><w:t>a</w:t><w:noBreakHyphen/><w:t>b</w:t><w:br w:type="page"/>'
+        '</w:r>'
+    ))
+
+def add_content_control(doc):
+    body = doc.element.body
+    p = copy.deepcopy(text_paragraphs(doc)[0]._p)
+    sdt = parse_xml(f'<w:sdt {nsdecls("w")}><w:sdtPr/><w:sdtContent/></w:sdt>')
+    sdt[1].append(p)
+    body.insert(0, sdt)
+
+def merge_cells(doc):
+    table = doc.tables[0]
+    table.cell(5, 0).merge(table.cell(5, 1))
+    use_courier(table.cell(5, 3))
+
+def merge_rows(doc):
+    table = doc.tables[0]
+    table.cell(5, 0).merge(table.cell(6, 0))
+    use_courier(table.cell(6, 3))
+
+def skip_first_grid_column(doc):
+    table = doc.tables[0]
+    tr = table.rows[4]._tr
+    tr.remove(tr.tc_lst[0])
+    grid_before = OxmlElement("w:gridBefore")
+    grid_before.set(qn("w:val"), "1")
+    tr.get_or_add_trPr().append(grid_before)
+    use_courier(_Cell(tr.tc_lst[-1], table))
+
+def nest_table(doc):
+    nested = doc.tables[0].cell(4, 0).add_table(rows=1, cols=2)
+    nested.cell(0, 0).text = "Nested"
+    use_courier(nested.cell(0, 0))
+
+def drop_table_formatting(doc):
+    for tbl in doc.element.body.iterchildren(qn("w:tbl")):
+        tbl_pr = tbl.tblPr
+        for child in tbl_pr.findall(qn("w:tblCellMar")):
+            tbl_pr.remove(child)
+        for tr_pr in tbl.iter(qn("w:trPr")):
+            tr_pr.getparent().remove(tr_pr)
+
+EDGE_CASES = [
+    add_hyperlink,
+    add_breaks,
+    add_content_control,
+    merge_cells,
+    merge_rows,
+    skip_first_grid_column,
+    nest_table,
+    drop_table_formatting,
+]
+
+def assert_same_issues(path):
+    assert validate_output(path) == validate_output(Document(path))
+
+@pytest.mark.parametrize("input_path", INPUT_FILES, ids=lambda p: p.name)
+def test_path_and_document_agree_on_inputs(input_path):
+    assert_same_issues(input_path)
+
+@pytest.mark.parametrize("input_path", INPUT_FILES, ids=lambda p: p.name)
+def test_path_and_document_agree_on_outputs(input_path, tmp_path):
+    output_path = tmp_path / input_path.name
+    processed_document(input_path, output_path).save(output_path)
+
+    assert_same_issues(output_path)
+
+@pytest.mark.parametrize("edit", EDGE_CASES, ids=lambda f: f.__name__)
+def test_path_and_document_agree_on_edge_cases(edit, tmp_path):
+    """
+    The streaming reader must see the same cells and text as python-docx on structures
+    the sample inputs don't have.
+    """
+    output_path = tmp_path / "edited.docx"
+    doc = processed_document(INPUT_FILES[0], output_path)
+    edit(doc)
+    doc.save(output_path)
+
+    assert_same_issues(output_path)
+
+def set_size(paragraph, value):
+    """
+    Writes a raw <w:sz> value on every run of the paragraph.
+    """
+    for run in paragraph.runs:
+        run._r.get_or_add_rPr().get_or_add_sz().set(qn("w:val"), value)
+
+def test_sizes_in_points_match_half_points(tmp_path):
+    output_path = tmp_path / "points.docx"
+    doc = processed_document(INPUT_FILES[0], output_path)
+    title, statements = text_paragraphs(doc)[:2]
+    set_size(title, "14pt")
+    set_size(statements, "9pt")
+    doc.save(output_path)
+
+    assert validate_output(output_path) == []
+    assert_same_issues(output_path)
+
+def test_wrong_size_in_points_is_reported(tmp_path):
+    output_path = tmp_path / "points.docx"
+    doc = processed_document(INPUT_FILES[0], output_path)
+    set_size(text_paragraphs(doc)[1], "10pt")
+    doc.save(output_path)
+
+    issues = validate_output(output_path)
+    assert any("Size=10.0" in issue for issue in issues)
+    assert_same_issues(output_path)
+
+def first_data_cell_indent(doc):
+    """
+    Returns the <w:ind> of the first column paragraph that the hanging indent check reads.
+    """
+    table = doc.tables[0]
+    cell = next(row.cells[0] for row in table.rows[1:] if row.cells[0].text.strip())
+    return cell.paragraphs[0]._p.get_or_add_pPr().get_or_add_ind()
+
+def test_indent_in_centimeters_matches_twips(tmp_path):
+    output_path = tmp_path / "indent.docx"
+    doc = processed_document(INPUT_FILES[0], output_path)
+    ind = first_data_cell_indent(doc)
+    ind.set(qn("w:left"), "0.63cm")
+    ind.set(qn("w:hanging"), "0.63cm")
+    doc.save(output_path)
+
+    assert validate_output(output_path) == []
+    assert_same_issues(output_path)
+
+def test_grid_widths_in_centimeters_match_twips(tmp_path):
+    output_path = tmp_path / "widths.docx"
+    doc = processed_document(INPUT_FILES[0], output_path)
+    grid_col = doc.tables[0]._tbl.tblGrid.gridCol_lst[0]
+    grid_col.set(qn("w:w"), "11.99cm")
+    doc.save(output_path)
+
+    assert validate_output(output_path) == []
+    assert_same_issues(output_path)
+
+@pytest.mark.parametrize("height, expected_issues", [
+    ("0.5cm", []),
+    ("0.2cm", ["   [FAIL] One or more rows have incorrect height."]),
+])
+def test_row_heights_in_centimeters(height, expected_issues, tmp_path):
+    output_path = tmp_path / "heights.docx"
+    doc = processed_document(INPUT_FILES[0], output_path)
+    tr_height = doc.tables[0].rows[1]._tr.trPr.find(qn("w:trHeight"))
+    tr_height.set(qn("w:val"), height)
+    doc.save(output_path)
+
+    assert validate_output(output_path) == expected_issues
+    assert_same_issues(output_path)
+
+def test_fail_fast_reads_fonts_when_it_gets_to_them(tmp_path):
+    """
+    With fail_fast the font failures are only read once the earlier checks have passed.
+    """
+    output_path = tmp_path / "fonts.docx"
+    doc = processed_document(INPUT_FILES[0], output_path)
+    add_breaks(doc)
+    doc.save(output_path)
+
+    issues = validate_output(output_path)
+    assert issues[0].startswith("   [FAIL] Font Issue")
+    assert validate_output(output_path, fail_fast=True) == issues[:1]
+    assert validate_output(Document(output_path), fail_fast=True) == issues[:1]